@@ -10,18 +10,21 @@ Key Components:
 - PubMedClient: The low-level async client for PubMed API interaction.
 - Paper, Author, AffiliationType: Data models for representing search results.
 - get_papers: A high-level async function for programmatic use.
+- aclose_shared_client: Closes the connection pool shared by all clients.
 """
 from __future__ import annotations
 
 import asyncio
+from contextlib import aclosing
 from typing import List
 
-from .client import PubMedClient
+from .client import PubMedClient, aclose_shared_client
 from .models import AffiliationType, Author, Paper
 
 __all__: list[str] = [
     "get_papers",
     "PubMedClient",
+    "aclose_shared_client",
     "Paper",
     "Author",
     "AffiliationType",
@@ -32,6 +35,9 @@ async def get_papers(
     query: str,
     filter_non_academic: bool = True,
     show_progress: bool = False,
+    api_key: str | None = None,
+    tool: str | None = None,
+    email: str | None = None,
 ) -> List[Paper]:
     """
     High-level async function to search for papers on PubMed.
@@ -45,15 +51,22 @@ async def get_papers(
                              author from a non-academic institution.
                              If False, returns all papers found.
         show_progress: If True, displays a progress bar in the console.
+        api_key: Optional NCBI API key, raising the request limit from 3 to 10
+                 requests per second.
+        tool: Optional tool name sent to NCBI to identify the caller.
+        email: Optional contact email sent to NCBI alongside `tool`.
 
     Returns:
         A list of Paper objects.
     """
-    client = PubMedClient(show_progress=show_progress)
+    client = PubMedClient(
+        show_progress=show_progress, api_key=api_key, tool=tool, email=email
+    )
     try:
-        all_papers = await client.search(query)
-        if filter_non_academic:
-            return [p for p in all_papers if p.non_academic_authors()]
-        return all_papers
+        async with aclosing(client.search(query)) as papers:
+            return [
+                p async for p in papers
+                if not filter_non_academic or p.non_academic_authors()
+            ]
     finally:
         await client.aclose()
\ No newline at end of file
@@ -2,12 +2,18 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import aclosing
 from typing import Optional
 
 import typer
 from rich import print
 from rich.console import Console
 
+try:
+    import uvloop
+except ImportError:  # Optional speedup (not available on Windows).
+    uvloop = None  # type: ignore[assignment]
+
 from .client import PubMedClient
 from .exporter import to_console, to_csv, ColumnSet
 
@@ -25,8 +31,8 @@ def main(
     file: Optional[str] = typer.Option(
         None, "--file", "-f", help="Save results to a CSV file (e.g., 'results.csv')."
     ),
-    columns: str = typer.Option(
-        "default", "--columns", "-c", 
+    column_set: ColumnSet = typer.Option(
+        ColumnSet.DEFAULT, "--columns", "-c", case_sensitive=False,
         help="Column set to include: 'default', 'all', or 'minimal'."
     ),
     custom_columns: Optional[str] = typer.Option(
@@ -39,6 +45,10 @@ def main(
     show_progress: bool = typer.Option(
         True, "--progress/--no-progress", help="Display a progress bar during fetching."
     ),
+    api_key: Optional[str] = typer.Option(
+        None, "--api-key", envvar="NCBI_API_KEY",
+        help="NCBI API key, allowing 10 instead of 3 requests per second.",
+    ),
     debug: bool = typer.Option(
         False, "--debug", "-d", help="Print debug information during execution."
     ),
@@ -62,13 +72,7 @@ def main(
     get-papers-list "machine learning" --include-abstract
     ```
     """
-    # Validate columns parameter
-    if columns not in ["default", "all", "minimal"]:
-        console.print(f"[bold red]Error: Invalid column set '{columns}'. Must be 'default', 'all', or 'minimal'.[/bold red]")
-        raise typer.Exit(1)
-    
-    column_set = ColumnSet(columns)
-    
+    # Typer validates --columns against ColumnSet, so no manual check is needed here.
     if debug:
         console.print(f"[dim]Debug mode enabled[/dim]")
         console.print(f"[dim]Query: {query}[/dim]")
@@ -79,21 +83,23 @@ def main(
     print(f"[bold green]Searching PubMed for:[/bold green] [yellow]'{query}'[/yellow]")
 
     async def _run() -> None:
-        client = PubMedClient(show_progress=show_progress)
+        client = PubMedClient(show_progress=show_progress, api_key=api_key)
         try:
             # 1. Fetch all papers matching the query
             if debug:
                 console.print("[dim]Fetching papers from PubMed...[/dim]")
             
-            all_papers = await client.search(query)
-            
-            if debug:
-                console.print(f"[dim]Found {len(all_papers)} total papers[/dim]")
-
-            # 2. Filter for papers with at least one non-academic author
-            filtered_papers = [p for p in all_papers if p.non_academic_authors()]
+            # 2. Keep papers with at least one non-academic author as they stream in
+            total_papers = 0
+            filtered_papers = []
+            async with aclosing(client.search(query)) as papers:
+                async for paper in papers:
+                    total_papers += 1
+                    if paper.non_academic_authors():
+                        filtered_papers.append(paper)
             
             if debug:
+                console.print(f"[dim]Found {total_papers} total papers[/dim]")
                 console.print(f"[dim]Filtered to {len(filtered_papers)} papers with non-academic authors[/dim]")
 
             if not filtered_papers:
@@ -118,7 +124,11 @@ def main(
         finally:
             await client.aclose()
 
-    asyncio.run(_run())
+    # uvloop.run mirrors asyncio.run, including cancelling _run cleanly on Ctrl+C.
+    if uvloop is not None:
+        uvloop.run(_run())
+    else:
+        asyncio.run(_run())
 
 
 if __name__ == "__main__":
@@ -1,20 +1,75 @@
 # src/paperscraper/client.py
 from __future__ import annotations
 
+import asyncio
+import json
 import re
-import xml.etree.ElementTree as ET
+import time
 from datetime import date, datetime
-from typing import Iterable, List
+from functools import lru_cache
+from typing import AsyncGenerator, AsyncIterator, Iterable, List
 
 import httpx
+from lxml import etree  # type: ignore[import-untyped]
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib decoder.
+    orjson = None  # type: ignore[assignment]
+
 from .filters import classify_affiliation
 from .models import Author, Paper
 
+# Both decoders accept the raw response bytes, which skips httpx's charset detection
+# and str decode of the (up to 10k-ID) esearch payload.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
 EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
-FETCH_BATCH_SIZE = 200
+_YEAR_RE = re.compile(r"\b(\d{4})\b")
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12
+}
+# efetch IDs are sent in a POST body, so batches are not limited by URL length.
+FETCH_BATCH_SIZE = 500
+# NCBI allows 3 requests/second without an API key and 10 with one. The rate
+# limiter spaces request starts accordingly; the concurrency caps only bound how
+# many slow responses may be in flight at once.
+REQUESTS_PER_SECOND = 3
+REQUESTS_PER_SECOND_WITH_KEY = 10
+MAX_CONCURRENT_FETCHES = 3
+MAX_CONCURRENT_FETCHES_WITH_KEY = 10
+# Requests answered with 429 Too Many Requests are retried with exponential backoff.
+MAX_RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 1.0
+
+# efetch responses are fed to the XML parser in chunks of this many bytes.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Per-article lookups, compiled once. The string()/count() forms are evaluated
+# entirely inside libxml2 and return "" / 0.0 when nothing matches; plain (not
+# "smart") strings avoid keeping a reference back into the tree being cleared.
+_XP_PMID = etree.XPath("string(.//PMID)", smart_strings=False)
+_XP_TITLE = etree.XPath("string(.//ArticleTitle)", smart_strings=False)
+_XP_ABSTRACTS = etree.XPath(".//Abstract/AbstractText")
+_XP_DOI = etree.XPath("string(.//ArticleId[@IdType='doi'])", smart_strings=False)
+_XP_JOURNAL = etree.XPath("string(.//Journal/Title)", smart_strings=False)
+_XP_REFCOUNT = etree.XPath("count(.//ReferenceList/Reference)")
+_XP_AUTHORS = etree.XPath(".//Author")
+
+# A single HTTP/2 connection pool is shared by the PubMedClients running on an event
+# loop so concurrent and back-to-back searches reuse warm connections instead of
+# paying a new TLS handshake. Each client holds one reference to the pool and the
+# pool is closed when the last reference is released.
+_shared_client: httpx.AsyncClient | None = None
+_shared_loop: asyncio.AbstractEventLoop | None = None
+_shared_refs = 0
+
+# NCBI enforces its request rate per IP address (or per API key), not per client, so
+# every PubMedClient in the process draws from the same limiter for its key mode.
+_rate_limiters: dict[bool, _RateLimiter] = {}
 
 
 class PubMedError(Exception):
@@ -22,27 +77,132 @@ class PubMedError(Exception):
     pass
 
 
+class _RateLimiter:
+    """Spaces request starts at least `1 / rate` seconds apart."""
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        """Waits until the next request slot; slots are handed out in call order."""
+        # time.monotonic rather than loop.time so the schedule survives a change of loop.
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        # Reserve the slot before sleeping so concurrent callers queue up behind it.
+        self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+def _get_rate_limiter(with_api_key: bool) -> _RateLimiter:
+    """Returns the process-wide rate limiter for requests with or without an API key."""
+    limiter = _rate_limiters.get(with_api_key)
+    if limiter is None:
+        rate = REQUESTS_PER_SECOND_WITH_KEY if with_api_key else REQUESTS_PER_SECOND
+        limiter = _rate_limiters[with_api_key] = _RateLimiter(rate)
+    return limiter
+
+
+def _acquire_shared_client() -> httpx.AsyncClient:
+    """Returns the shared HTTPX client and takes a reference on it.
+
+    Connections are bound to the event loop that opened them, so a new client is
+    created whenever the running loop changes or the previous one was closed. A
+    client left open by a previous loop can no longer be closed (its transports
+    belong to that loop), which is why every reference must be released before the
+    loop ends.
+    """
+    global _shared_client, _shared_loop, _shared_refs
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_loop is not loop:
+        _shared_client = httpx.AsyncClient(
+            http2=True,
+            headers={"User-Agent": "paperscraper/1.0.0"},
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=32,
+                keepalive_expiry=60.0,
+            ),
+        )
+        _shared_loop = loop
+        _shared_refs = 0
+    _shared_refs += 1
+    return _shared_client
+
+
+async def _release_shared_client(client: httpx.AsyncClient) -> None:
+    """Drops a reference taken by `_acquire_shared_client`, closing the pool on the last one."""
+    global _shared_refs
+    if client is not _shared_client:
+        # Already closed or replaced by a pool for another loop.
+        return
+    _shared_refs -= 1
+    if _shared_refs <= 0:
+        await aclose_shared_client()
+
+
+async def aclose_shared_client() -> None:
+    """Closes the shared HTTPX client regardless of how many clients still use it.
+
+    Must be awaited on the event loop that opened the client; a client from an
+    earlier loop cannot be closed any more and is simply dropped.
+    """
+    global _shared_client, _shared_loop, _shared_refs
+    if _shared_client is not None and _shared_loop is asyncio.get_running_loop():
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_loop = None
+    _shared_refs = 0
+
+
 class PubMedClient:
     """Asynchronous client for fetching and parsing data from the PubMed API."""
 
-    def __init__(self, *, show_progress: bool = False, timeout: float = 30.0) -> None:
+    def __init__(
+        self,
+        *,
+        show_progress: bool = False,
+        timeout: float = 30.0,
+        api_key: str | None = None,
+        tool: str | None = None,
+        email: str | None = None,
+    ) -> None:
         self.show_progress = show_progress
-        self._client = httpx.AsyncClient(
-            timeout=timeout, 
-            headers={"User-Agent": "paperscraper/1.0.0"},
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
-        )
+        self.api_key = api_key
+        self.tool = tool
+        self.email = email
+        self.timeout = timeout
+        self._pool: httpx.AsyncClient | None = None
+        self._rate_limiter = _get_rate_limiter(bool(api_key))
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        pool = self._pool
+        if (
+            pool is None
+            or pool is not _shared_client
+            or pool.is_closed
+            or _shared_loop is not asyncio.get_running_loop()
+        ):
+            # First use, or the pool was closed or belongs to another loop: take a new reference.
+            pool = self._pool = _acquire_shared_client()
+        return pool
+
+    async def search(self, query: str) -> AsyncGenerator[Paper, None]:
+        """Yield Paper objects matching the PubMed query, in esearch order.
 
-    async def search(self, query: str) -> List[Paper]:
-        """Return a list of Paper objects matching the PubMed query."""
+        Batches are fetched in the background. If you may stop iterating early,
+        wrap the call in `contextlib.aclosing` so outstanding batches are cancelled
+        as soon as you leave the loop rather than when the generator is collected.
+        """
         if not query.strip():
             raise ValueError("Query cannot be empty")
         
         pmids = await self._esearch(query)
         if not pmids:
-            return []
+            return
 
-        papers: List[Paper] = []
         progress = Progress(
             SpinnerColumn(),
             BarColumn(),
@@ -50,31 +210,68 @@ class PubMedClient:
             TextColumn("[progress.percentage]{task.completed}/{task.total}"),
             TimeElapsedColumn(),
             disable=not self.show_progress,
+            # Slightly below Rich's default of 10 redraws per second.
+            refresh_per_second=8,
         )
         
         task = progress.add_task("Fetching paper details...", total=len(pmids))
         
-        with progress:
-            for i, chunk in enumerate(self._grouper(pmids, FETCH_BATCH_SIZE)):
+        limit = MAX_CONCURRENT_FETCHES_WITH_KEY if self.api_key else MAX_CONCURRENT_FETCHES
+        semaphore = asyncio.Semaphore(limit)
+
+        async def _run(i: int, chunk: List[str]) -> List[Paper]:
+            async with semaphore:
                 try:
-                    fetched_papers = await self._efetch(chunk)
-                    papers.extend(fetched_papers)
-                    progress.update(task, advance=len(chunk))
+                    return [p async for p in self._efetch(chunk)]
                 except httpx.HTTPStatusError as e:
                     if self.show_progress:
                         progress.console.print(f"[bold red]HTTP Error fetching batch {i+1}: {e}[/bold red]")
                     # Continue with other batches
-                    progress.update(task, advance=len(chunk))
+                    return []
                 except Exception as e:
                     if self.show_progress:
                         progress.console.print(f"[bold red]Error fetching batch {i+1}: {e}[/bold red]")
-                    progress.update(task, advance=len(chunk))
-                    
-        return papers
+                    return []
+                finally:
+                    progress.advance(task, len(chunk))
+
+        with progress:
+            tasks = [
+                asyncio.create_task(_run(i, chunk))
+                for i, chunk in enumerate(self._grouper(pmids, FETCH_BATCH_SIZE))
+            ]
+            try:
+                # Batches run concurrently but are consumed in esearch order so
+                # results come out in the same order on every run.
+                for batch in tasks:
+                    for paper in await batch:
+                        yield paper
+            finally:
+                # Stop outstanding batches once the generator is closed early.
+                for t in tasks:
+                    t.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
 
     async def aclose(self) -> None:
-        """Closes the underlying HTTPX client."""
-        await self._client.aclose()
+        """Releases this client's reference on the shared connection pool.
+
+        The pool is closed once no client on the event loop holds it any more;
+        must be awaited before the loop ends.
+        """
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            await _release_shared_client(pool)
+
+    def _common_params(self) -> dict[str, str]:
+        """Returns the NCBI identification parameters shared by all E-utilities calls."""
+        params: dict[str, str] = {}
+        if self.api_key:
+            params["api_key"] = self.api_key
+        if self.tool:
+            params["tool"] = self.tool
+        if self.email:
+            params["email"] = self.email
+        return params
 
     async def _esearch(self, query: str) -> List[str]:
         """Performs an `esearch` query to get a list of PubMed IDs (PMIDs)."""
@@ -82,13 +279,21 @@ class PubMedClient:
             "db": "pubmed", 
             "retmax": 10_000, 
             "term": query, 
-            "retmode": "json"
+            "retmode": "json",
+            **self._common_params(),
         }
         
         try:
-            response = await self._client.get(f"{BASE_URL}/esearch.fcgi", params=params)
+            for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+                await self._rate_limiter.wait()
+                response = await self._client.get(
+                    f"{BASE_URL}/esearch.fcgi", params=params, timeout=self.timeout
+                )
+                if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                    break
+                await asyncio.sleep(self._retry_delay(response, attempt))
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             
             # Check for API errors
             if "esearchresult" not in data:
@@ -117,68 +322,106 @@ class PubMedClient:
         except (KeyError, ValueError) as e:
             raise PubMedError(f"Error parsing search response: {e}")
 
-    async def _efetch(self, pmids: Iterable[str]) -> List[Paper]:
-        """Performs an `efetch` query to get detailed article information."""
-        params = {
+    async def _efetch(self, pmids: Iterable[str]) -> AsyncIterator[Paper]:
+        """Performs an `efetch` query, yielding articles as the response streams in."""
+        data = {
             "db": "pubmed", 
             "rettype": "abstract", 
             "retmode": "xml", 
-            "id": ",".join(pmids)
+            "id": ",".join(pmids),
+            **self._common_params(),
         }
         
         try:
-            response = await self._client.get(f"{BASE_URL}/efetch.fcgi", params=params)
-            response.raise_for_status()
-            return list(self._parse_xml(response.text))
+            for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+                await self._rate_limiter.wait()
+                async with self._client.stream(
+                    "POST",
+                    f"{BASE_URL}/efetch.fcgi",
+                    data=data,
+                    headers={"Accept-Encoding": "gzip"},
+                    timeout=self.timeout,
+                ) as response:
+                    if response.status_code == 429 and attempt < MAX_RATE_LIMIT_RETRIES:
+                        delay = self._retry_delay(response, attempt)
+                    else:
+                        response.raise_for_status()
+                        async for paper in self._parse_xml(response.aiter_bytes(STREAM_CHUNK_SIZE)):
+                            yield paper
+                        return
+                await asyncio.sleep(delay)
         except httpx.RequestError as e:
             raise PubMedError(f"Network error during fetch: {e}")
         except httpx.HTTPStatusError as e:
             raise PubMedError(f"HTTP error during fetch: {e}")
 
-    def _parse_xml(self, xml_text: str) -> Iterable[Paper]:
-        """Parses the XML from an efetch response into Paper objects."""
+    async def _parse_xml(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[Paper]:
+        """Incrementally parses efetch XML into Paper objects as bytes arrive."""
+        parser = etree.XMLPullParser(events=("end",), tag="PubmedArticle", huge_tree=True)
         try:
-            root = ET.fromstring(xml_text)
-        except ET.ParseError as e:
+            async for chunk in chunks:
+                parser.feed(chunk)
+                for paper in self._read_articles(parser):
+                    yield paper
+            parser.close()
+        except etree.XMLSyntaxError as e:
             raise PubMedError(f"Error parsing XML response: {e}")
-        
-        for article in root.findall(".//PubmedArticle"):
+
+        for paper in self._read_articles(parser):
+            yield paper
+
+    def _read_articles(self, parser: etree.XMLPullParser) -> Iterable[Paper]:
+        """Drains completed PubmedArticle elements from the parser, freeing each one."""
+        for _, article in parser.read_events():
             try:
                 paper = self._parse_article(article)
                 if paper:
                     yield paper
             except Exception as e:
                 # Skip malformed articles but continue processing others
-                pmid = article.findtext(".//PMID", "unknown")
+                pmid = _XP_PMID(article) or "unknown"
                 if self.show_progress:
                     print(f"Warning: Skipping article {pmid} due to parsing error: {e}")
                 continue
+            finally:
+                # Drop the parsed article and any earlier siblings so memory stays bounded.
+                article.clear(keep_tail=True)
+                while article.getprevious() is not None:
+                    del article.getparent()[0]
 
-    def _parse_article(self, article: ET.Element) -> Paper | None:
+    def _parse_article(self, article: etree._Element) -> Paper | None:
         """Parse a single PubmedArticle element into a Paper object."""
-        pmid = article.findtext(".//PMID")
+        pmid = _XP_PMID(article)
         if not pmid:
             return None
 
         # Core fields
-        title = article.findtext(".//ArticleTitle") or "(no title)"
-        abstract_nodes = article.findall(".//Abstract/AbstractText")
-        abstract = "\n".join(node.text for node in abstract_nodes if node.text)
+        title = _XP_TITLE(article) or "(no title)"
+        # itertext() keeps text inside inline markup such as <i> or <sup>, like the title.
+        sections = ("".join(node.itertext()) for node in _XP_ABSTRACTS(article))
+        abstract = "\n".join(section for section in sections if section)
         pub_date = self._parse_date(article)
-        doi = article.findtext(".//ArticleId[@IdType='doi']")
-        journal_title = article.findtext(".//Journal/Title")
-        ref_count = len(article.findall(".//ReferenceList/Reference"))
+        doi = _XP_DOI(article) or None
+        journal_title = _XP_JOURNAL(article) or None
+        ref_count = int(_XP_REFCOUNT(article))
 
         # Author parsing
         authors: List[Author] = []
-        for author_el in article.findall(".//Author"):
-            name_parts = [
-                author_el.findtext("ForeName") or "", 
-                author_el.findtext("LastName") or ""
-            ]
+        for author_el in _XP_AUTHORS(article):
+            # Author elements are shallow, so one pass over the children replaces
+            # separate lookups for each field.
+            fore_name = last_name = affil_text = None
+            for child in author_el:
+                tag = child.tag
+                if tag == "ForeName":
+                    fore_name = child.text
+                elif tag == "LastName":
+                    last_name = child.text
+                elif tag == "AffiliationInfo" and affil_text is None:
+                    affil_node = child.find("Affiliation")
+                    affil_text = affil_node.text if affil_node is not None else None
+            name_parts = [fore_name or "", last_name or ""]
             full_name = " ".join(p for p in name_parts if p).strip() or "(anonymous)"
-            affil_node = author_el.find(".//AffiliationInfo/Affiliation")
-            affil_text = affil_node.text if affil_node is not None else None
             email = self._extract_email(affil_text)
             affil_type = classify_affiliation(affil_text)
             authors.append(Author(full_name, affil_text, email, affil_type))
@@ -194,6 +437,14 @@ class PubMedClient:
             reference_count=ref_count,
         )
 
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying a 429, honouring a numeric Retry-After."""
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+        return RATE_LIMIT_BACKOFF * 2 ** attempt
+
     @staticmethod
     def _grouper(seq: List[str], size: int) -> Iterable[List[str]]:
         """Yields successive n-sized chunks from a list."""
@@ -201,32 +452,44 @@ class PubMedClient:
             yield seq[i : i + size]
 
     @staticmethod
+    @lru_cache(maxsize=16_384)
     def _extract_email(affil: str | None) -> str | None:
         """Extracts an email address from affiliation text."""
-        if not affil:
+        # Most affiliations carry no email; a substring check is far cheaper than the regex.
+        if not affil or "@" not in affil:
             return None
         match = EMAIL_RE.search(affil)
         return match.group(0) if match else None
 
-    def _parse_date(self, article_el: ET.Element) -> date:
+    def _parse_date(self, article_el: etree._Element) -> date:
         """Parses the publication date from various XML formats."""
-        year_str = article_el.findtext(".//PubDate/Year")
+        year_str = month_str = day_str = medline_date = None
+        pub_date = article_el.find(".//PubDate")
+        if pub_date is not None:
+            for child in pub_date:
+                tag = child.tag
+                if tag == "Year":
+                    year_str = child.text
+                elif tag == "Month":
+                    month_str = child.text
+                elif tag == "Day":
+                    day_str = child.text
+                elif tag == "MedlineDate":
+                    medline_date = child.text
+
         if year_str:
-            month_str = article_el.findtext(".//PubDate/Month") or "1"
-            day_str = article_el.findtext(".//PubDate/Day") or "1"
             try:
                 return datetime(
                     int(year_str), 
-                    self._month_to_int(month_str), 
-                    int(day_str)
+                    self._month_to_int(month_str or "1"), 
+                    int(day_str or "1")
                 ).date()
             except (ValueError, TypeError):
                 return datetime(int(year_str), 1, 1).date()
 
-        medline_date = article_el.findtext(".//MedlineDate")
         if medline_date:
             try:
-                year_match = re.search(r"\b(\d{4})\b", medline_date)
+                year_match = _YEAR_RE.search(medline_date)
                 if year_match:
                     return datetime(int(year_match.group(1)), 1, 1).date()
             except ValueError:
@@ -237,10 +500,7 @@ class PubMedClient:
     @staticmethod
     def _month_to_int(m: str) -> int:
         """Converts month string (e.g., 'Jan', '01') to an integer."""
-        _MONTHS = {
-            "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
-            "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12
-        }
         if m.isdigit():
             return max(1, min(12, int(m)))  # Clamp to valid month range
-        return _MONTHS.get(m[:3].title(), 1)
\ No newline at end of file
+        # PubMed months are usually already 'Jan'-style, so try the exact key first.
+        return _MONTHS.get(m) or _MONTHS.get(m[:3].title(), 1)
\ No newline at end of file
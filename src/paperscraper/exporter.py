@@ -4,7 +4,7 @@ from __future__ import annotations
 import csv
 from enum import Enum
 from pathlib import Path
-from typing import Iterable, List, Optional, Set
+from typing import Callable, Dict, Iterable, List, Optional
 
 from rich.console import Console
 from rich.table import Table
@@ -42,6 +42,9 @@ MINIMAL_HEADERS = [
     "Company Affiliation(s)",
 ]
 
+# Large write buffer so big exports are flushed in a few large writes.
+CSV_BUFFER_SIZE = 8 * 1024 * 1024
+
 
 class ColumnSet(str, Enum):
     """Predefined column sets for output."""
@@ -50,6 +53,13 @@ class ColumnSet(str, Enum):
     MINIMAL = "minimal"
 
 
+HEADERS_BY_SET = {
+    ColumnSet.DEFAULT: DEFAULT_HEADERS,
+    ColumnSet.ALL: ALL_HEADERS,
+    ColumnSet.MINIMAL: MINIMAL_HEADERS,
+}
+
+
 def _get_headers(
     column_set: ColumnSet, 
     custom_columns: Optional[str], 
@@ -68,14 +78,7 @@ def _get_headers(
         return headers
     
     # Use predefined column sets
-    if column_set == ColumnSet.DEFAULT:
-        headers = DEFAULT_HEADERS[:]
-    elif column_set == ColumnSet.ALL:
-        headers = ALL_HEADERS[:]
-    elif column_set == ColumnSet.MINIMAL:
-        headers = MINIMAL_HEADERS[:]
-    else:
-        headers = DEFAULT_HEADERS[:]
+    headers = HEADERS_BY_SET.get(column_set, DEFAULT_HEADERS)[:]
     
     if include_abstract:
         headers.append("Abstract")
@@ -83,26 +86,38 @@ def _get_headers(
     return headers
 
 
-def _get_paper_data(paper: Paper, headers: List[str]) -> List[str]:
-    """Get paper data for the specified headers."""
-    # Map header names to paper data
-    data_map = {
-        "PubmedID": paper.pmid,
-        "Title": paper.title,
-        "Publication Date": paper.publication_date.isoformat(),
-        "Non-academic Author(s)": "; ".join(a.name for a in paper.non_academic_authors()),
-        "Academic Author(s)": "; ".join(a.name for a in paper.academic_authors()),
-        "Unknown Author(s)": "; ".join(a.name for a in paper.unknown_authors()),
-        "Company Affiliation(s)": "; ".join(paper.company_affiliations()),
-        "Corresponding Email": paper.corresponding_email() or "",
-        "DOI": paper.doi or "",
-        "Journal": paper.journal_title or "",
-        "Reference Count": str(paper.reference_count),
-        "PubMed URL": paper.pubmed_url(),
-        "Abstract": paper.formatted_abstract(),
-    }
-    
-    return [data_map.get(header, "") for header in headers]
+# Column name -> function producing that cell for a paper. Rows are built only from
+# the getters of the selected headers, so unused columns cost nothing.
+_COLUMN_GETTERS: Dict[str, Callable[[Paper], str]] = {
+    "PubmedID": lambda p: p.pmid,
+    "Title": lambda p: p.title,
+    "Publication Date": lambda p: p.publication_date.isoformat(),
+    "Non-academic Author(s)": lambda p: "; ".join(a.name for a in p.non_academic_authors()),
+    "Academic Author(s)": lambda p: "; ".join(a.name for a in p.academic_authors()),
+    "Unknown Author(s)": lambda p: "; ".join(a.name for a in p.unknown_authors()),
+    "Company Affiliation(s)": lambda p: "; ".join(p.company_affiliations()),
+    "Corresponding Email": lambda p: p.corresponding_email() or "",
+    "DOI": lambda p: p.doi or "",
+    "Journal": lambda p: p.journal_title or "",
+    "Reference Count": lambda p: str(p.reference_count),
+    "PubMed URL": lambda p: p.pubmed_url(),
+    "Abstract": lambda p: p.formatted_abstract(),
+}
+
+
+def _empty_cell(paper: Paper) -> str:
+    """Getter used for headers with no known column."""
+    return ""
+
+
+def _compile_row_builder(headers: List[str]) -> List[Callable[[Paper], str]]:
+    """Resolve the cell getters for the given headers once, ahead of the rows."""
+    return [_COLUMN_GETTERS.get(header, _empty_cell) for header in headers]
+
+
+def _get_paper_data(paper: Paper, getters: List[Callable[[Paper], str]]) -> List[str]:
+    """Get paper data using getters from `_compile_row_builder`."""
+    return [getter(paper) for getter in getters]
 
 
 def to_csv(
@@ -117,12 +132,12 @@ def to_csv(
     path.parent.mkdir(parents=True, exist_ok=True)
     
     headers = _get_headers(column_set, custom_columns, include_abstract)
+    getters = _compile_row_builder(headers)
     
-    with path.open("w", newline="", encoding="utf-8") as handle:
+    with path.open("w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as handle:
         writer = csv.writer(handle)
         writer.writerow(headers)
-        for paper in papers:
-            writer.writerow(_get_paper_data(paper, headers))
+        writer.writerows(_get_paper_data(paper, getters) for paper in papers)
 
 
 def to_console(
@@ -132,8 +147,8 @@ def to_console(
     custom_columns: Optional[str] = None,
 ) -> None:
     """Pretty-print a list of Paper objects to the console using Rich."""
-    papers_list = list(papers)  # Convert to list to avoid consuming iterator
     headers = _get_headers(column_set, custom_columns, include_abstract)
+    getters = _compile_row_builder(headers)
     
     table = Table(show_header=True, header_style="bold cyan", box=None, min_width=100)
     
@@ -146,9 +161,11 @@ def to_console(
         else:
             table.add_column(header, overflow="fold")
     
-    for paper in papers_list:
-        table.add_row(*_get_paper_data(paper, headers))
+    count = 0
+    for paper in papers:
+        table.add_row(*_get_paper_data(paper, getters))
+        count += 1
     
     console = Console()
     console.print(table)
-    console.print(f"\n[bold green]Found {len(papers_list)} papers with non-academic authors[/bold green]")
\ No newline at end of file
+    console.print(f"\n[bold green]Found {count} papers with non-academic authors[/bold green]")
\ No newline at end of file
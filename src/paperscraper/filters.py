@@ -2,10 +2,16 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 from .models import AffiliationType
 
+try:
+    import ahocorasick  # type: ignore[import-not-found]
+except ImportError:  # Optional speedup; fall back to the compiled regex.
+    ahocorasick = None  # type: ignore[assignment]
+
 # Keywords that strongly suggest a non-commercial, academic, or research entity.
 # Using word boundaries (\b) to avoid matching substrings (e.g., 'corp' in 'incorporate').
 ACADEMIC_KEYWORDS = {
@@ -39,11 +45,77 @@ NON_ACADEMIC_KEYWORDS = {
     r"\bag\b",
 }
 
-# Compile regex for efficiency
-ACADEMIC_RE = re.compile("|".join(ACADEMIC_KEYWORDS), re.IGNORECASE)
-NON_ACADEMIC_RE = re.compile("|".join(NON_ACADEMIC_KEYWORDS), re.IGNORECASE)
+# Both keyword sets are compiled into one alternation so an affiliation is scanned
+# once; the named group that matched tells us which set the keyword came from.
+# Used when pyahocorasick is unavailable.
+AFFILIATION_RE = re.compile(
+    f"(?P<{AffiliationType.NON_ACADEMIC.name}>{'|'.join(sorted(NON_ACADEMIC_KEYWORDS))})"
+    f"|(?P<{AffiliationType.ACADEMIC.name}>{'|'.join(sorted(ACADEMIC_KEYWORDS))})",
+    re.IGNORECASE,
+)
+
+
+def _build_automaton() -> ahocorasick.Automaton:
+    """Build one Aho-Corasick automaton over both keyword sets, minus the \\b markers."""
+    automaton = ahocorasick.Automaton()
+    for keywords, affil_type in (
+        (NON_ACADEMIC_KEYWORDS, AffiliationType.NON_ACADEMIC),
+        (ACADEMIC_KEYWORDS, AffiliationType.ACADEMIC),
+    ):
+        for keyword in keywords:
+            word = keyword.replace(r"\b", "").lower()
+            automaton.add_word(word, (len(word), affil_type))
+    automaton.make_automaton()
+    return automaton
+
+
+AFFILIATION_AC = _build_automaton() if ahocorasick is not None else None
+
+
+# Characters that re.IGNORECASE treats as 'i' and 's' but that str.lower() leaves
+# alone; folding them one-for-one keeps match offsets aligned with the original.
+_IGNORECASE_FOLD = str.maketrans({"ı": "i", "ſ": "s"})
+
 
+def _is_word_char(ch: str) -> bool:
+    """Mirror the regex engine's notion of a \\w character."""
+    return ch.isalnum() or ch == "_"
 
+
+def _classify_with_automaton(automaton: ahocorasick.Automaton, affiliation: str) -> AffiliationType:
+    """Single Aho-Corasick scan, emulating \\b by checking the characters around each hit."""
+    text = affiliation.lower().translate(_IGNORECASE_FOLD)
+    if len(text) != len(affiliation):
+        # A few characters (e.g. 'İ') lower-case to several code points, which would
+        # shift match offsets away from the original string.
+        return _classify_with_regex(affiliation)
+    last = len(text) - 1
+    result = AffiliationType.UNKNOWN
+    for end, (length, affil_type) in automaton.iter(text):
+        start = end - length + 1
+        if start > 0 and _is_word_char(affiliation[start - 1]):
+            continue
+        if end < last and _is_word_char(affiliation[end + 1]):
+            continue
+        if affil_type is AffiliationType.NON_ACADEMIC:
+            return AffiliationType.NON_ACADEMIC
+        result = AffiliationType.ACADEMIC
+    return result
+
+
+def _classify_with_regex(affiliation: str) -> AffiliationType:
+    """Fallback classifier used when pyahocorasick is not installed."""
+    result = AffiliationType.UNKNOWN
+    for match in AFFILIATION_RE.finditer(affiliation):
+        if match.lastgroup == AffiliationType.NON_ACADEMIC.name:
+            return AffiliationType.NON_ACADEMIC
+        result = AffiliationType.ACADEMIC
+    return result
+
+
+# Affiliation strings repeat heavily across co-authors and papers from the same
+# institution, and classification is pure, so results are memoized.
+@lru_cache(maxsize=16_384)
 def classify_affiliation(affiliation: Optional[str]) -> AffiliationType:
     """
     Classify an affiliation string using keyword-based heuristics.
@@ -60,12 +132,8 @@ def classify_affiliation(affiliation: Optional[str]) -> AffiliationType:
     if not affiliation:
         return AffiliationType.UNKNOWN
 
-    # Non-academic keywords are often more specific, so check them first.
-    if NON_ACADEMIC_RE.search(affiliation):
-        return AffiliationType.NON_ACADEMIC
-
-    if ACADEMIC_RE.search(affiliation):
-        return AffiliationType.ACADEMIC
-
-    return AffiliationType.UNKNOWN
-
+    # Non-academic keywords are often more specific, so they win as soon as one is
+    # seen; an academic match only decides the result once the whole string is scanned.
+    if AFFILIATION_AC is not None:
+        return _classify_with_automaton(AFFILIATION_AC, affiliation)
+    return _classify_with_regex(affiliation)
@@ -53,7 +53,11 @@ class Author:
 
 @dataclass(slots=True)
 class Paper:
-    """Representation of a PubMed article relevant to our scraper."""
+    """Representation of a PubMed article relevant to our scraper.
+
+    Author groupings are derived once at construction, so `authors` should be
+    treated as read-only afterwards.
+    """
 
     pmid: str
     title: str
@@ -64,30 +68,40 @@ class Paper:
     journal_title: Optional[str] = None
     reference_count: int = 0
 
+    # Derived data, computed once in __post_init__ since exporters read it per column.
+    _academic: List[Author] = field(init=False, repr=False, compare=False)
+    _non_academic: List[Author] = field(init=False, repr=False, compare=False)
+    _unknown: List[Author] = field(init=False, repr=False, compare=False)
+    _companies: List[str] = field(init=False, repr=False, compare=False)
+    _corresponding_email: Optional[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._academic = [a for a in self.authors if a.is_academic()]
+        self._non_academic = [a for a in self.authors if a.is_non_academic()]
+        self._unknown = [a for a in self.authors if a.is_unknown()]
+        self._companies = sorted({a.affiliation for a in self._non_academic if a.affiliation})
+        self._corresponding_email = next((a.email for a in self.authors if a.email), None)
+
     # Derived data helpers
     def academic_authors(self) -> List[Author]:
         """Return authors classified as academic."""
-        return [a for a in self.authors if a.is_academic()]
+        return self._academic
 
     def non_academic_authors(self) -> List[Author]:
         """Return authors classified as non-academic."""
-        return [a for a in self.authors if a.is_non_academic()]
+        return self._non_academic
 
     def unknown_authors(self) -> List[Author]:
         """Return authors with unclassified affiliations."""
-        return [a for a in self.authors if a.is_unknown()]
+        return self._unknown
 
     def company_affiliations(self) -> List[str]:
         """Unique set of company names among non-academic authors."""
-        companies = {a.affiliation for a in self.non_academic_authors() if a.affiliation}
-        return sorted(list(companies))
+        return self._companies
 
     def corresponding_email(self) -> Optional[str]:
         """Return the first email encountered among all authors."""
-        for author in self.authors:
-            if author.email:
-                return author.email
-        return None
+        return self._corresponding_email
 
     def formatted_abstract(self) -> str:
         """Return a clean version of the abstract."""
@@ -0,0 +1,102 @@
+import asyncio
+from typing import AsyncIterator, List
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+from lxml import etree  # type: ignore[import-untyped]
+
+import paperscraper.client as client_module
+from paperscraper import PubMedClient, get_papers
+
+
+def _article(pmid: str) -> bytes:
+    return (
+        f"<PubmedArticle><MedlineCitation><PMID>{pmid}</PMID><Article>"
+        f"<ArticleTitle>Paper {pmid}</ArticleTitle>"
+        "<AuthorList><Author><LastName>Smith</LastName><ForeName>Ann</ForeName>"
+        "<AffiliationInfo><Affiliation>Pfizer Inc, New York</Affiliation></AffiliationInfo>"
+        "</Author></AuthorList></Article></MedlineCitation></PubmedArticle>"
+    ).encode()
+
+
+class _ArticleStream(httpx.AsyncByteStream):
+    """Streams articles slowly, failing like a dropped connection once the pool is closed."""
+
+    def __init__(self, transport: "_PubMedTransport", pmids: List[str]) -> None:
+        self._transport = transport
+        self._pmids = pmids
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield b"<PubmedArticleSet>"
+        for pmid in self._pmids:
+            await asyncio.sleep(0.005)
+            if self._transport.closed:
+                raise httpx.ReadError("connection closed")
+            yield _article(pmid)
+        yield b"</PubmedArticleSet>"
+
+
+class _PubMedTransport(httpx.MockTransport):
+    """Serves canned esearch/efetch responses; the esearch term is the number of hits."""
+
+    def __init__(self) -> None:
+        super().__init__(self._handle)
+        self.closed = False
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("esearch.fcgi"):
+            count = int(request.url.params["term"])
+            idlist = [str(i) for i in range(1, count + 1)]
+            return httpx.Response(200, json={"esearchresult": {"idlist": idlist}})
+        pmids = parse_qs(request.content.decode())["id"][0].split(",")
+        return httpx.Response(200, stream=_ArticleStream(self, pmids))
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def mock_pubmed(monkeypatch: pytest.MonkeyPatch) -> None:
+    class MockAsyncClient(httpx.AsyncClient):
+        def __init__(self, **kwargs):
+            super().__init__(transport=_PubMedTransport(), **kwargs)
+
+    monkeypatch.setattr(client_module.httpx, "AsyncClient", MockAsyncClient)
+    monkeypatch.setattr(client_module, "FETCH_BATCH_SIZE", 10)
+    monkeypatch.setattr(client_module, "REQUESTS_PER_SECOND", 1000)
+    monkeypatch.setattr(client_module, "_rate_limiters", {})
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_pubmed")
+async def test_overlapping_clients_share_the_pool() -> None:
+    # The small search finishes and closes its client while the large one is still reading.
+    small, large = await asyncio.gather(get_papers("5"), get_papers("100"))
+
+    assert [p.pmid for p in small] == [str(i) for i in range(1, 6)]
+    assert [p.pmid for p in large] == [str(i) for i in range(1, 101)]
+    assert client_module._shared_client is None
+
+
+def test_clients_share_a_rate_limiter_per_key_mode() -> None:
+    anonymous = PubMedClient()._rate_limiter
+    keyed = PubMedClient(api_key="secret")._rate_limiter
+
+    assert PubMedClient()._rate_limiter is anonymous
+    assert PubMedClient(api_key="other")._rate_limiter is keyed
+    assert keyed is not anonymous
+
+
+def test_abstract_keeps_inline_markup() -> None:
+    article = etree.fromstring(
+        "<PubmedArticle><MedlineCitation><PMID>1</PMID><Article><Abstract>"
+        "<AbstractText>Growth of <i>E. coli</i> in H<sub>2</sub>O.</AbstractText>"
+        "<AbstractText/>"
+        "<AbstractText>Second section.</AbstractText>"
+        "</Abstract></Article></MedlineCitation></PubmedArticle>"
+    )
+
+    paper = PubMedClient()._parse_article(article)
+
+    assert paper.abstract == "Growth of E. coli in H2O.\nSecond section."
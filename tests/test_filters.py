@@ -0,0 +1,55 @@
+import pytest
+
+from paperscraper.filters import (
+    AFFILIATION_AC,
+    _classify_with_automaton,
+    _classify_with_regex,
+)
+from paperscraper.models import AffiliationType
+
+pytestmark = pytest.mark.skipif(AFFILIATION_AC is None, reason="pyahocorasick is not installed")
+
+
+@pytest.mark.parametrize(
+    "affiliation",
+    [
+        # Case folding that changes length or differs between str.lower() and re.
+        "İstanbul University",
+        "İSTANBUL UNİVERSİTY, Acme Inc",
+        "Harvard Univerſity",
+        "Acme ınc",
+        "UNIVERSITÄT WIEN",
+        "Straße 5, Pfizer GmbH",
+        "STRASSE 5, Biotech",
+        # Ligatures are not expanded by either classifier.
+        "Oﬃce of Research, Acme Ltd",
+        "ﬁrst Institute",
+        # Word boundaries: underscores and digits are word characters.
+        "acme_inc",
+        "LTD_2",
+        "inc2",
+        "2inc",
+        "Acme Inc.",
+        "(Corp)",
+        "AG",
+        "Bag",
+        "incorporated",
+        "Universitéinc",
+        # Multiword phrases must match exactly, including the single space.
+        "School of Medicine, Boston",
+        "school  of medicine",
+        "Medical Center",
+        "medical-center",
+        # A non-academic keyword wins regardless of position.
+        "Harvard University and Genentech Inc",
+        "Genentech Inc, Harvard University",
+        "",
+    ],
+)
+def test_automaton_matches_regex(affiliation: str) -> None:
+    assert _classify_with_automaton(AFFILIATION_AC, affiliation) is _classify_with_regex(affiliation)
+
+
+def test_automaton_emulates_word_boundaries() -> None:
+    assert _classify_with_automaton(AFFILIATION_AC, "Bag End") is AffiliationType.UNKNOWN
+    assert _classify_with_automaton(AFFILIATION_AC, "Siemens AG") is AffiliationType.NON_ACADEMIC